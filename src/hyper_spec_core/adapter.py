@@ -6,17 +6,25 @@ the governance artifacts generated by hyper-governance-core's codex weave comman
 
 from __future__ import annotations
 
+import json
+import os
 import re
 import sys
-from dataclasses import dataclass, field
+import tempfile
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING
-
-import yaml
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     pass
 
+# Leading keys of the flat `codex weave` stack.yaml layout
+_FLAT_STACK_KEYS = ("python_version:", "allowed_libraries:")
+_FLAT_KEY_RE = re.compile(r"([A-Za-z_][\w-]*):(?: +(.*?))? *")
+_FLAT_ITEM_RE = re.compile(r"( *)- +(.*?) *")
+_PLAIN_SCALAR_RE = re.compile(r"[A-Za-z_][\w.+-]*")
+_YAML_RESERVED_WORDS = frozenset({"true", "false", "yes", "no", "on", "off", "null", "y", "n"})
+
 
 @dataclass
 class GovernanceContext:
@@ -60,6 +68,99 @@ class GovernanceContext:
         return "\n".join(sections)
 
 
+def _load_yaml(text: str) -> Any:
+    """Parse YAML safely, importing PyYAML only when a document needs it.
+
+    Args:
+        text: YAML document.
+
+    Returns:
+        Parsed document.
+    """
+    import yaml
+
+    return yaml.safe_load(text)
+
+
+def _parse_flat_scalar(raw: str) -> str | None:
+    """Parse a scalar from the flat stack.yaml layout.
+
+    Only quoted strings and plain identifiers that YAML would also read as
+    strings are accepted.
+
+    Args:
+        raw: Scalar text with surrounding whitespace removed.
+
+    Returns:
+        The string value, or None if the scalar needs a full YAML parser.
+    """
+    if len(raw) >= 2 and raw[0] == raw[-1] == "'":
+        inner = raw[1:-1]
+        return None if "'" in inner.replace("''", "") else inner.replace("''", "'")
+    if len(raw) >= 2 and raw[0] == raw[-1] == '"' and "\\" not in raw and '"' not in raw[1:-1]:
+        return raw[1:-1]
+    if _PLAIN_SCALAR_RE.fullmatch(raw) and raw.lower() not in _YAML_RESERVED_WORDS:
+        return raw
+    return None
+
+
+def _parse_flat_stack(text: str) -> dict[str, Any] | None:
+    """Parse the flat ``codex weave`` stack.yaml layout without a YAML parser.
+
+    Handles top-level ``key: scalar`` pairs and ``key:`` followed by ``- item``
+    lines at one consistent indent, which is all `codex weave` emits. Anything
+    else (nesting, flow collections, comments, anchors, continuation lines) is
+    left to the full YAML parser.
+
+    Args:
+        text: Contents of stack.yaml.
+
+    Returns:
+        Parsed mapping, or None if the document is not in the flat layout.
+    """
+    # YAML rejects tabs in most positions, so leave them to the real parser
+    if "\t" in text or not text.lstrip().startswith(_FLAT_STACK_KEYS):
+        return None
+
+    data: dict[str, Any] = {}
+    key: str | None = None
+    item_indent: str | None = None
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+
+        item = _FLAT_ITEM_RE.fullmatch(line)
+        if item:
+            indent, raw_item = item.groups()
+            value = _parse_flat_scalar(raw_item)
+            if key is None or value is None:
+                return None
+            if data[key] is None:
+                data[key] = []
+                item_indent = indent
+            elif item_indent is None or indent != item_indent:
+                # A differently indented dash is a continuation or nested sequence
+                return None
+            data[key].append(value)
+            continue
+
+        pair = _FLAT_KEY_RE.fullmatch(line)
+        if pair is None or pair.group(1) in data:
+            return None
+        key, raw = pair.groups()
+        item_indent = None
+        if not raw:
+            data[key] = None
+        elif raw == "[]":
+            data[key] = []
+        else:
+            data[key] = _parse_flat_scalar(raw)
+            if data[key] is None:
+                return None
+
+    return data
+
+
 class GovernanceAdapter:
     """Adapter for loading and parsing governance artifacts from .codex directory.
 
@@ -77,6 +178,8 @@ class GovernanceAdapter:
     STACK_FILE = "stack.yaml"
     SECURITY_FILE = "security.md"
     ARCHITECTURE_FILE = "architecture.md"
+    CACHE_FILE = ".context.json"
+    CACHE_VERSION = 1
 
     def __init__(self, governance_path: Path) -> None:
         """Initialize the adapter with the path to governance artifacts.
@@ -89,6 +192,9 @@ class GovernanceAdapter:
     def load_context(self) -> GovernanceContext:
         """Load and parse all governance artifacts into a unified context.
 
+        Complete contexts are cached in ``CACHE_FILE`` inside the governance
+        directory and reused while the artifacts' mtimes and sizes are unchanged.
+
         Returns:
             GovernanceContext containing parsed governance rules.
 
@@ -109,6 +215,11 @@ class GovernanceAdapter:
                 "Run 'codex weave' in the governance repo."
             )
 
+        fingerprint = self._fingerprint()
+        cached = self._read_cache(fingerprint)
+        if cached is not None:
+            return cached
+
         # Parse stack.yaml
         allowed_libs, banned_libs = self._parse_stack_yaml(stack_path)
 
@@ -127,13 +238,80 @@ class GovernanceAdapter:
             "Architectural Layers",
         )
 
-        return GovernanceContext(
+        context = GovernanceContext(
             allowed_libs=allowed_libs,
             banned_libs=banned_libs,
             security_controls=security_controls,
             architectural_layers=architectural_layers,
         )
 
+        # Incomplete contexts are not cached so their warnings repeat on every load
+        if security_controls and architectural_layers:
+            self._write_cache(fingerprint, context)
+
+        return context
+
+    def _fingerprint(self) -> list[list[int] | None]:
+        """Fingerprint the artifacts by modification time and size.
+
+        Returns:
+            One ``[mtime_ns, size]`` entry per artifact, None for missing files.
+        """
+        fingerprint: list[list[int] | None] = []
+        for name in (self.STACK_FILE, self.SECURITY_FILE, self.ARCHITECTURE_FILE):
+            try:
+                st = os.stat(self.governance_path / name)
+            except FileNotFoundError:
+                fingerprint.append(None)
+            else:
+                fingerprint.append([st.st_mtime_ns, st.st_size])
+        return fingerprint
+
+    def _read_cache(self, fingerprint: list[list[int] | None]) -> GovernanceContext | None:
+        """Load a previously parsed context if the artifacts are unchanged.
+
+        Args:
+            fingerprint: Current artifact fingerprint.
+
+        Returns:
+            Cached GovernanceContext, or None if absent, stale or unreadable.
+        """
+        try:
+            cache = json.loads((self.governance_path / self.CACHE_FILE).read_bytes())
+            if cache["version"] != self.CACHE_VERSION or cache["fingerprint"] != fingerprint:
+                return None
+            return GovernanceContext(**cache["context"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_cache(self, fingerprint: list[list[int] | None], context: GovernanceContext) -> None:
+        """Atomically persist a parsed context next to the artifacts.
+
+        Failures (e.g. a read-only governance directory) are ignored.
+
+        Args:
+            fingerprint: Artifact fingerprint the context was parsed from.
+            context: Parsed governance context.
+        """
+        payload = {
+            "version": self.CACHE_VERSION,
+            "fingerprint": fingerprint,
+            "context": asdict(context),
+        }
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=self.governance_path, prefix=self.CACHE_FILE)
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp_name, self.governance_path / self.CACHE_FILE)
+        except OSError:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
     def _parse_stack_yaml(self, stack_path: Path) -> tuple[list[str], list[str]]:
         """Parse stack.yaml to extract allowed and banned libraries.
 
@@ -155,8 +333,10 @@ class GovernanceAdapter:
         Returns:
             Tuple of (allowed_libraries, banned_libraries) lists.
         """
-        with stack_path.open() as f:
-            data = yaml.safe_load(f) or {}
+        text = stack_path.read_text()
+        data = _parse_flat_stack(text)
+        if data is None:
+            data = _load_yaml(text) or {}
 
         # Try flat format first (actual codex weave output)
         allowed = data.get("allowed_libraries")
@@ -194,7 +374,10 @@ class GovernanceAdapter:
         Returns:
             Extracted content between tags, or empty string if not found.
         """
-        if not file_path.exists():
+        # Read directly instead of checking exists() first
+        try:
+            content = file_path.read_text()
+        except FileNotFoundError:
             print(
                 f"Warning: Governance artifact '{file_path.name}' not found. "
                 f"'{section_name}' will be empty.",
@@ -202,7 +385,6 @@ class GovernanceAdapter:
             )
             return ""
 
-        content = file_path.read_text()
         extracted = self._extract_section(content, start_tag, end_tag)
 
         if not extracted:
@@ -216,7 +398,7 @@ class GovernanceAdapter:
 
     @staticmethod
     def _extract_section(content: str, start_tag: str, end_tag: str) -> str:
-        """Extract content between anchor tags using regex.
+        """Extract content between literal anchor tags.
 
         Args:
             content: Full file content.
@@ -226,14 +408,13 @@ class GovernanceAdapter:
         Returns:
             Content between tags (stripped), or empty string if not found.
         """
-        # Escape special regex characters in tags
-        start_escaped = re.escape(start_tag)
-        end_escaped = re.escape(end_tag)
-
-        pattern = rf"{start_escaped}\s*(.*?)\s*{end_escaped}"
-        match = re.search(pattern, content, re.DOTALL)
+        start = content.find(start_tag)
+        if start == -1:
+            return ""
 
-        if match:
-            return match.group(1).strip()
+        start += len(start_tag)
+        end = content.find(end_tag, start)
+        if end == -1:
+            return ""
 
-        return ""
+        return content[start:end].strip()
@@ -1,30 +1,85 @@
-"""Hyper-Spec CLI: Integrated Spec-Driven Development Environment."""
+"""Hyper-Spec CLI: Integrated Spec-Driven Development Environment.
 
+Heavy dependencies (jinja2, rich) are imported inside the commands
+that use them so that ``--help`` and error paths stay cheap. Arguments are
+parsed by a small table-driven dispatcher (``main``); the Typer ``app`` is
+built on first access and used when ``HYPER_SPEC_LEGACY_CLI=1`` is set.
+"""
+
+from __future__ import annotations
+
+import functools
 import json
 import os
 import shlex
+import shutil
 import subprocess
+import sys
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Optional
-
-import typer
-from jinja2 import Environment, PackageLoader, FileSystemLoader
-from pydantic import BaseModel
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
+from typing import TYPE_CHECKING, Any, Optional
 
 from hyper_spec_core.adapter import GovernanceAdapter
 
-# Initialize Typer and Rich Console
-app = typer.Typer(help="Hyper-Spec: Integrated Spec-Driven Development")
-console = Console()
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON."""
+        return orjson.dumps(obj)
+
+except ImportError:  # orjson is provided by the optional 'fast' extra
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+if TYPE_CHECKING:
+    import typer
+    from jinja2 import Environment
+    from rich.console import Console
+
+APP_NAME = "hyper-spec"
+APP_HELP = "Hyper-Spec: Integrated Spec-Driven Development"
 
 # Constants
 SPECS_DIR = Path("specs")
 TEMPLATES_DIR = SPECS_DIR / ".templates"
 VSCODE_DIR = Path(".vscode")
+SPEC_FILENAME = "spec.md"
+PLAN_FILENAME = "plan.md"
+CONTEXT_FILENAME = "context.json"
+TEMPLATE_NAMES = ("spec_template.md", "plan_template.md")
 DEFAULT_VALIDATOR_CMD = "codex validate --stack --ast"
+COMPLEXITY_CHOICES = [str(i) for i in range(1, 11)]
+# Placeholder context.json, pre-serialized since it never varies
+CONTEXT_STUB = b'{\n  "spec_checksum": "TODO"\n}\n'
+
+
+@functools.cache
+def _console() -> Console:
+    """Return the shared Rich console, importing rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """Create or truncate ``path`` and write ``data`` with raw file descriptors.
+
+    Args:
+        path: Destination file.
+        data: Encoded file contents.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
 
 
 def resolve_gov_path(cli_path: Optional[Path]) -> Path:
@@ -63,20 +118,117 @@ def get_template_env() -> Environment:
     """Get Jinja2 Environment with template loader.
 
     Priority: local specs/.templates/ > bundled package templates.
+    The Environment is cached per process so compiled templates are reused.
 
     Returns:
         Configured Jinja2 Environment.
     """
-    # Priority: local .templates/ for customization (only if it contains template files)
-    if TEMPLATES_DIR.exists() and any(TEMPLATES_DIR.glob("*.md")):
-        return Environment(loader=FileSystemLoader(TEMPLATES_DIR))
+    return _template_env(_use_local_templates(), str(TEMPLATES_DIR))
+
+
+def _use_local_templates() -> bool:
+    """Whether local specs/.templates/ overrides the bundled templates."""
+    # Only if it contains template files
+    return TEMPLATES_DIR.exists() and any(TEMPLATES_DIR.glob("*.md"))
+
+
+def render_template(name: str, context: Mapping[str, Any]) -> str:
+    """Render a spec/plan template.
+
+    Bundled templates are rendered by a precompiled Jinja-free renderer; local
+    overrides and templates needing full Jinja syntax go through Jinja.
+
+    Args:
+        name: Template file name, e.g. ``spec_template.md``.
+        context: Template variables.
+
+    Returns:
+        Rendered template text.
+    """
+    if not _use_local_templates():
+        from hyper_spec_core.templates._compiled import bundled_renderer
+
+        renderer = bundled_renderer(name)
+        if renderer is not None:
+            return renderer(context)
+
+    return get_template_env().get_template(name).render(**context)
+
+
+@functools.lru_cache(maxsize=2)
+def _template_env(use_local: bool, templates_dir: str) -> Environment:
+    """Build the Jinja2 Environment for a given template source.
+
+    Args:
+        use_local: Whether to load templates from ``templates_dir``.
+        templates_dir: Directory holding local template overrides.
+
+    Returns:
+        Jinja2 Environment over preloaded template sources, with compiled templates
+        persisted to an on-disk bytecode cache between invocations.
+    """
+    from jinja2 import (
+        BaseLoader,
+        ChoiceLoader,
+        DictLoader,
+        Environment,
+        FileSystemBytecodeCache,
+        FileSystemLoader,
+    )
+
+    # The spec/plan templates are held in memory, so their lookups never touch
+    # the filesystem; anything else a local override includes is loaded lazily
+    loader: BaseLoader = DictLoader(_template_sources(use_local, templates_dir))
+    if use_local:
+        loader = ChoiceLoader([loader, FileSystemLoader(templates_dir)])
+
+    # Jinja keys cached bytecode by template checksum, so edits invalidate it.
+    # The default directory is per-user and Jinja verifies it is owned by us
+    # with mode 0700 before trusting anything in it.
+    bytecode_cache: FileSystemBytecodeCache | None = None
+    try:
+        bytecode_cache = FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        pass  # No safe cache dir: compile in memory only
+
+    return Environment(
+        loader=loader, auto_reload=False, cache_size=400, bytecode_cache=bytecode_cache
+    )
 
-    # Fall back to bundled templates from package
-    return Environment(loader=PackageLoader("hyper_spec_core", "templates"))
 
+def _template_sources(use_local: bool, templates_dir: str) -> dict[str, str]:
+    """Read the template sources up front.
 
-class FeatureSpec(BaseModel):
-    """Pydantic model for feature specifications."""
+    Args:
+        use_local: Whether to read templates from ``templates_dir``.
+        templates_dir: Directory holding local template overrides.
+
+    Returns:
+        Mapping of template name to source. Local overrides are limited to
+        ``TEMPLATE_NAMES`` so unrelated files in the directory are never read.
+    """
+    if use_local:
+        sources: dict[str, str] = {}
+        for name in TEMPLATE_NAMES:
+            try:
+                sources[name] = (Path(templates_dir) / name).read_text(encoding="utf-8")
+            except FileNotFoundError:
+                continue
+        return sources
+
+    from importlib import resources
+
+    package = resources.files("hyper_spec_core.templates")
+    return {
+        entry.name: entry.read_text(encoding="utf-8")
+        for entry in package.iterdir()
+        if entry.name.endswith(".md")
+    }
+
+
+@dataclass(slots=True)
+class FeatureSpec:
+    """Data model for feature specifications."""
 
     feature_name: str
     author: str
@@ -87,62 +239,73 @@ class FeatureSpec(BaseModel):
     anti_requirements: list[str]
     success_criteria: list[str]
 
+    def model_dump(self) -> dict[str, Any]:
+        """Return the fields as a dict (Pydantic-compatible helper)."""
+        return asdict(self)
 
-class ImplementationPlan(BaseModel):
-    """Pydantic model for implementation plans."""
+
+@dataclass(slots=True)
+class ImplementationPlan:
+    """Data model for implementation plans."""
 
     summary: str
     file_changes: list[dict]
     logic_steps: list[str]
     verification_strategy: list[str]
 
+    def model_dump(self) -> dict[str, Any]:
+        """Return the fields as a dict (Pydantic-compatible helper)."""
+        return asdict(self)
 
-@app.command()
-def init(
-    force: bool = typer.Option(False, "--force", "-f", help="Force re-initialization"),
-) -> None:
+
+def __getattr__(name: str) -> Any:
+    """Lazily build the Typer app on first access (PEP 562)."""
+    if name == "app":
+        return _build_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def init(force: bool = False) -> None:
     """Bootstrap the .vscode and specs directories. Checks for uv."""
+    from rich.panel import Panel
+
+    console = _console()
     console.print(Panel("[bold blue]Hyper-Spec Initialization[/bold blue]"))
 
-    # Check for uv using subprocess (governance-compliant)
-    result = subprocess.run(
-        ["uv", "--version"],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
+    # Check for uv with a PATH lookup rather than spawning it
+    if shutil.which("uv") is None:
         console.print(
             "[bold red]Error:[/bold red] 'uv' is not installed. Please install it first."
         )
-        raise typer.Exit(code=1)
+        raise SystemExit(1)
     console.print("[green]✓[/green] 'uv' detected.")
 
     # Create directories
     dirs = [SPECS_DIR, TEMPLATES_DIR, VSCODE_DIR]
     for d in dirs:
-        if not d.exists():
+        # mkdir reports existing directories itself, so no separate exists() stat
+        try:
             d.mkdir(parents=True)
-            console.print(f"[green]✓[/green] Created {d}")
-        else:
+        except FileExistsError:
             console.print(f"[yellow]![/yellow] {d} already exists.")
+        else:
+            console.print(f"[green]✓[/green] Created {d}")
 
     console.print("[bold green]Initialization Complete![/bold green]")
 
 
-@app.command()
-def new(
-    name: str = typer.Option(..., "--name", "-n", help="Name of the feature"),
-    interactive: bool = typer.Option(
-        True, "--interactive/--no-interactive", help="Run interactive steering interview"
-    ),
-) -> None:
+def new(name: str, interactive: bool = True) -> None:
     """Create a new feature branch and spec file. Runs the steering interview."""
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+
+    console = _console()
     console.print(Panel(f"[bold blue]Creating New Feature Spec: {name}[/bold blue]"))
 
     feature_dir = SPECS_DIR / name
     if feature_dir.exists():
         console.print(f"[bold red]Error:[/bold red] Feature '{name}' already exists.")
-        raise typer.Exit(code=1)
+        raise SystemExit(1)
 
     feature_dir.mkdir()
 
@@ -155,74 +318,145 @@ def new(
         )
         context["complexity"] = Prompt.ask(
             "Estimated Complexity Score (1-10)?",
-            choices=[str(i) for i in range(1, 11)],
+            choices=COMPLEXITY_CHOICES,
             default="3",
         )
 
     # Load Template
-    env = get_template_env()
     try:
-        template = env.get_template("spec_template.md")
-        content = template.render(**context)
+        content = render_template("spec_template.md", context)
     except Exception as e:
         console.print(f"[bold red]Error loading template:[/bold red] {e}")
         # Fallback if template doesn't exist yet (during bootstrapping)
         content = f"# Feature Specification: {name}\n\nTODO: Fill this out."
 
-    spec_file = feature_dir / "spec.md"
-    spec_file.write_text(content)
+    spec_file = feature_dir / SPEC_FILENAME
+    _write_file(spec_file, content.encode("utf-8"))
     console.print(f"[green]✓[/green] Created {spec_file}")
 
     # Create context.json for checksums (placeholder)
-    context_file = feature_dir / "context.json"
-    context_file.write_text(json.dumps({"spec_checksum": "TODO"}, indent=2))
+    context_file = feature_dir / CONTEXT_FILENAME
+    _write_file(context_file, CONTEXT_STUB)
 
     console.print(f"[bold green]Feature '{name}' initialized![/bold green]")
     console.print(f"Open {spec_file} to define your requirements.")
 
 
-@app.command()
 def plan(
-    spec_file: Path = typer.Option(..., "--spec", "-s", help="Path to the spec file"),
-    model: str = typer.Option("gpt-4-turbo", "--model", "-m", help="LLM model to use"),
-    governance_path: Optional[Path] = typer.Option(
-        None,
-        "--governance-path",
-        "-g",
-        help="Path to .codex governance artifacts",
-    ),
+    spec_file: Path,
+    model: str = "gpt-4-turbo",
+    governance_path: Optional[Path] = None,
 ) -> None:
     """Read the Spec + Governance artifacts, generate a technical Plan."""
+    from rich.panel import Panel
+
+    console = _console()
     console.print(
         Panel(f"[bold blue]Generating Implementation Plan for {spec_file}[/bold blue]")
     )
 
     if not spec_file.exists():
         console.print(f"[bold red]Error:[/bold red] File {spec_file} not found.")
-        raise typer.Exit(code=1)
-
-    # Read Spec
-    spec_content = spec_file.read_text()
+        raise SystemExit(1)
 
     # Load Governance Context (The Artifact Handshake)
+    governance_prompt = _load_governance_prompt(governance_path)
+
+    console.print("[yellow]Thinking... (Simulating LLM call)[/yellow]")
+    plan_file = _generate_plan(spec_file, governance_prompt)
+
+    console.print(f"[green]✓[/green] Generated {plan_file}")
+    console.print("[bold green]Plan Generation Complete![/bold green]")
+
+
+def plan_batch(
+    spec_glob: str,
+    model: str = "gpt-4-turbo",
+    governance_path: Path | None = None,
+    max_concurrency: int = 8,
+    batch_file: Path | None = None,
+) -> None:
+    """Generate Plans for every Spec matching a glob, concurrently or via a batch file."""
+    import asyncio
+    import glob
+
+    from rich.panel import Panel
+
+    console = _console()
+    console.print(Panel(f"[bold blue]Generating Implementation Plans for {spec_glob}[/bold blue]"))
+
+    if max_concurrency < 1:
+        console.print("[bold red]Error:[/bold red] --max-concurrency must be at least 1.")
+        raise SystemExit(1)
+
+    # Patterns like 'specs/*' also match the feature directories themselves
+    spec_files = sorted(p for p in map(Path, glob.glob(spec_glob, recursive=True)) if p.is_file())
+    if not spec_files:
+        console.print(f"[bold red]Error:[/bold red] No spec files match {spec_glob}.")
+        raise SystemExit(1)
+
+    # Specs sharing a directory would race to write the same plan.md
+    plan_targets: dict[Path, Path] = {}
+    for spec_file in spec_files:
+        other = plan_targets.setdefault(spec_file.with_name(PLAN_FILENAME), spec_file)
+        if other != spec_file:
+            console.print(
+                f"[bold red]Error:[/bold red] {other} and {spec_file} would both write "
+                f"{spec_file.with_name(PLAN_FILENAME)}."
+            )
+            raise SystemExit(1)
+
+    # Governance is shared by every spec, so load it once for the whole batch
+    governance_prompt = _load_governance_prompt(governance_path)
+
+    if batch_file is not None:
+        _write_batch_requests(batch_file, spec_files, model, governance_prompt)
+        console.print(f"[green]✓[/green] Wrote {len(spec_files)} requests to {batch_file}")
+        console.print("Submit it with the OpenAI Batch API to generate plans at batch pricing.")
+        return
+
+    console.print(f"[yellow]Thinking... (Simulating {len(spec_files)} LLM calls)[/yellow]")
+    plan_files = asyncio.run(_plan_concurrently(spec_files, governance_prompt, max_concurrency))
+
+    for plan_file in plan_files:
+        console.print(f"[green]✓[/green] Generated {plan_file}")
+    console.print("[bold green]Plan Generation Complete![/bold green]")
+
+
+def _load_governance_prompt(governance_path: Path | None) -> str:
+    """Resolve and load governance artifacts as an LLM system-prompt fragment.
+
+    Args:
+        governance_path: Path provided via CLI flag, or None.
+
+    Returns:
+        Governance constraints, or a placeholder if none could be loaded.
+    """
+    console = _console()
     try:
         gov_path = resolve_gov_path(governance_path)
         console.print(f"[cyan]Loading governance context from {gov_path}...[/cyan]")
         adapter = GovernanceAdapter(gov_path)
         gov_context = adapter.load_context()
-        governance_prompt = gov_context.to_system_prompt()
         console.print("[green]✓[/green] Governance context loaded.")
-    except ValueError as e:
+        return gov_context.to_system_prompt()
+    except (ValueError, FileNotFoundError) as e:
         console.print(f"[bold yellow]Warning:[/bold yellow] {e}")
         console.print("[yellow]Proceeding without governance constraints.[/yellow]")
-        governance_prompt = "No governance constraints available."
-    except FileNotFoundError as e:
-        console.print(f"[bold yellow]Warning:[/bold yellow] {e}")
-        console.print("[yellow]Proceeding without governance constraints.[/yellow]")
-        governance_prompt = "No governance constraints available."
+        return "No governance constraints available."
 
-    # Prepare Prompt with Governance Context
-    _system_prompt = f"""
+
+def _build_plan_prompts(spec_content: str, governance_prompt: str) -> tuple[str, str]:
+    """Build the system and user prompts for plan generation.
+
+    Args:
+        spec_content: Feature specification markdown.
+        governance_prompt: Governance constraints for the system prompt.
+
+    Returns:
+        Tuple of (system_prompt, user_prompt).
+    """
+    system_prompt = f"""
 You are a Senior Architect. You must adhere to the following Live Governance Rules.
 Any plan that violates these rules will be rejected.
 
@@ -231,9 +465,25 @@ Any plan that violates these rules will be rejected.
 Based on the following Feature Specification, generate an Implementation Plan.
 """
 
-    _user_prompt = f"Feature Spec:\n{spec_content}"
+    user_prompt = f"Feature Spec:\n{spec_content}"
+    return system_prompt, user_prompt
 
-    console.print("[yellow]Thinking... (Simulating LLM call)[/yellow]")
+
+def _generate_plan(spec_file: Path, governance_prompt: str) -> Path:
+    """Generate plan.md next to a spec file.
+
+    Args:
+        spec_file: Path to the feature spec.
+        governance_prompt: Governance constraints for the system prompt.
+
+    Returns:
+        Path to the written plan file.
+    """
+    # Read Spec
+    spec_content = spec_file.read_text()
+
+    # Prepare Prompt with Governance Context
+    _system_prompt, _user_prompt = _build_plan_prompts(spec_content, governance_prompt)
 
     # In a real scenario, we would call OpenAI here.
     # client = instructor.patch(openai.OpenAI())
@@ -248,37 +498,88 @@ Based on the following Feature Specification, generate an Implementation Plan.
         "summary": f"Implementation plan for {feature_name} based on the provided spec.",
     }
 
-    env = get_template_env()
     try:
-        template = env.get_template("plan_template.md")
-        plan_content = template.render(**context)
+        plan_content = render_template("plan_template.md", context)
     except Exception as e:
-        console.print(f"[bold red]Error loading template:[/bold red] {e}")
+        _console().print(f"[bold red]Error loading template:[/bold red] {e}")
         plan_content = "# Implementation Plan\n\nError generating plan."
 
-    plan_file = spec_file.parent / "plan.md"
-    plan_file.write_text(plan_content)
+    plan_file = spec_file.with_name(PLAN_FILENAME)
+    _write_file(plan_file, plan_content.encode("utf-8"))
+    return plan_file
 
-    console.print(f"[green]✓[/green] Generated {plan_file}")
-    console.print("[bold green]Plan Generation Complete![/bold green]")
+
+async def _plan_concurrently(
+    spec_files: list[Path], governance_prompt: str, max_concurrency: int
+) -> list[Path]:
+    """Generate plans for several specs with bounded concurrency.
+
+    Args:
+        spec_files: Feature specs to plan.
+        governance_prompt: Governance constraints shared by every spec.
+        max_concurrency: Maximum number of plans generated at once.
+
+    Returns:
+        Paths to the written plan files, in ``spec_files`` order.
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def plan_one(spec_file: Path) -> Path:
+        async with semaphore:
+            return await asyncio.to_thread(_generate_plan, spec_file, governance_prompt)
+
+    return await asyncio.gather(*(plan_one(spec_file) for spec_file in spec_files))
+
+
+def _write_batch_requests(
+    batch_file: Path, spec_files: list[Path], model: str, governance_prompt: str
+) -> None:
+    """Write an OpenAI Batch API input file with one plan request per spec.
+
+    Args:
+        batch_file: Destination JSONL file.
+        spec_files: Feature specs to plan.
+        model: LLM model to request.
+        governance_prompt: Governance constraints shared by every spec.
+    """
+    lines: list[bytes] = []
+    for spec_file in spec_files:
+        system_prompt, user_prompt = _build_plan_prompts(spec_file.read_text(), governance_prompt)
+        request = {
+            "custom_id": str(spec_file),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": model,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+            },
+        }
+        lines.append(_dumps(request))
+    _write_file(batch_file, b"\n".join(lines) + b"\n")
 
 
-@app.command()
 def implement(
-    plan_file: Path = typer.Option(..., "--plan", "-p", help="Path to the plan file"),
-    auto_approve: bool = typer.Option(False, "--auto-approve", help="Skip confirmation"),
-    skip_validation: bool = typer.Option(
-        False, "--skip-validation", help="Skip governance validation"
-    ),
+    plan_file: Path,
+    auto_approve: bool = False,
+    skip_validation: bool = False,
 ) -> None:
     """Execute the Plan, generate code and run governance validation."""
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+
+    console = _console()
     console.print(
         Panel(f"[bold blue]Executing Implementation Plan: {plan_file}[/bold blue]")
     )
 
     if not plan_file.exists():
         console.print(f"[bold red]Error:[/bold red] File {plan_file} not found.")
-        raise typer.Exit(code=1)
+        raise SystemExit(1)
 
     _plan_content = plan_file.read_text()  # noqa: F841
 
@@ -292,7 +593,7 @@ def implement(
     if not auto_approve:
         if not Confirm.ask("Do you want to proceed with these changes?"):
             console.print("[yellow]Aborted.[/yellow]")
-            raise typer.Exit()
+            raise SystemExit(0)
 
     console.print("[green]Executing changes...[/green]")
     # Here we would actually write the files.
@@ -311,25 +612,37 @@ def _run_governance_validation() -> bool:
     Returns:
         True if validation passed, False otherwise.
     """
+    console = _console()
     cmd_str = os.getenv("HYPER_VALIDATOR_CMD", DEFAULT_VALIDATOR_CMD)
     cmd_args = shlex.split(cmd_str)
 
     console.print(f"[cyan]Running Governance Validation: {cmd_str}[/cyan]")
 
+    # Resolve up front so a missing validator fails without a fork/exec attempt
+    search_path = os.environ.get("PATH", os.defpath)
+    executable = _resolve_executable(cmd_args[0], search_path) if cmd_args else None
+
     try:
-        result = subprocess.run(
+        if executable is None:
+            raise FileNotFoundError(cmd_str)
+
+        # Stream output as it arrives instead of buffering it all in memory;
+        # stderr is merged into stdout so neither pipe can fill up and block
+        with subprocess.Popen(
             cmd_args,
+            executable=executable,
             cwd=os.getcwd(),
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-        )
-
-        if result.returncode != 0:
-            console.print("[bold red]Governance Violation Detected:[/bold red]")
-            if result.stdout:
-                console.print(result.stdout)
-            if result.stderr:
-                console.print(result.stderr, style="dim")
+            errors="replace",
+        ) as proc:
+            for line in proc.stdout or ():
+                console.out(line, end="", highlight=False)
+            returncode = proc.wait()
+
+        if returncode != 0:
+            console.print("[bold red]Governance Violation Detected[/bold red]")
             return False
         else:
             console.print("[bold green]✓ Governance Verified[/bold green]")
@@ -343,5 +656,338 @@ def _run_governance_validation() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=8)
+def _resolve_executable(name: str, search_path: str) -> str | None:
+    """Locate an executable on a PATH string.
+
+    Args:
+        name: Command name or path.
+        search_path: Value of $PATH, part of the cache key so PATH changes are seen.
+
+    Returns:
+        Full path to the executable, or None if it cannot be found.
+    """
+    return shutil.which(name, path=search_path)
+
+
+@dataclass(frozen=True)
+class ArgDef:
+    """Static description of a command-line option.
+
+    Attributes:
+        dest: Keyword argument name passed to the command function.
+        flags: Option spellings, long form first (e.g. ``("--name", "-n")``).
+        help: Help text shown in ``--help`` output.
+        kind: Value type; ``bool`` options are flags that take no value.
+        default: Value used when the option is omitted.
+        required: Whether the option must be supplied.
+        negation: Flag that sets a ``bool`` option to False (e.g. ``--no-interactive``).
+    """
+
+    dest: str
+    flags: tuple[str, ...]
+    help: str
+    kind: type = str
+    default: Any = None
+    required: bool = False
+    negation: str | None = None
+
+
+@dataclass(frozen=True)
+class CommandDef:
+    """Static description of a subcommand and its options."""
+
+    name: str
+    handler: Callable[..., None]
+    args: tuple[ArgDef, ...] = ()
+
+    @property
+    def help(self) -> str:
+        """First line of the handler docstring."""
+        return (self.handler.__doc__ or "").strip().splitlines()[0]
+
+
+COMMANDS: dict[str, CommandDef] = {
+    command.name: command
+    for command in (
+        CommandDef(
+            "init",
+            init,
+            (ArgDef("force", ("--force", "-f"), "Force re-initialization", bool, False),),
+        ),
+        CommandDef(
+            "new",
+            new,
+            (
+                ArgDef("name", ("--name", "-n"), "Name of the feature", required=True),
+                ArgDef(
+                    "interactive",
+                    ("--interactive",),
+                    "Run interactive steering interview",
+                    bool,
+                    True,
+                    negation="--no-interactive",
+                ),
+            ),
+        ),
+        CommandDef(
+            "plan",
+            plan,
+            (
+                ArgDef("spec_file", ("--spec", "-s"), "Path to the spec file", Path, required=True),
+                ArgDef("model", ("--model", "-m"), "LLM model to use", str, "gpt-4-turbo"),
+                ArgDef(
+                    "governance_path",
+                    ("--governance-path", "-g"),
+                    "Path to .codex governance artifacts",
+                    Path,
+                ),
+            ),
+        ),
+        CommandDef(
+            "plan-batch",
+            plan_batch,
+            (
+                ArgDef(
+                    "spec_glob",
+                    ("--specs", "-s"),
+                    "Glob matching spec files, e.g. 'specs/*/spec.md'",
+                    required=True,
+                ),
+                ArgDef("model", ("--model", "-m"), "LLM model to use", str, "gpt-4-turbo"),
+                ArgDef(
+                    "governance_path",
+                    ("--governance-path", "-g"),
+                    "Path to .codex governance artifacts",
+                    Path,
+                ),
+                ArgDef(
+                    "max_concurrency",
+                    ("--max-concurrency", "-j"),
+                    "Maximum plans generated at once",
+                    int,
+                    8,
+                ),
+                ArgDef(
+                    "batch_file",
+                    ("--batch-file",),
+                    "Write OpenAI Batch API requests to this JSONL file instead",
+                    Path,
+                ),
+            ),
+        ),
+        CommandDef(
+            "implement",
+            implement,
+            (
+                ArgDef("plan_file", ("--plan", "-p"), "Path to the plan file", Path, required=True),
+                ArgDef("auto_approve", ("--auto-approve",), "Skip confirmation", bool, False),
+                ArgDef(
+                    "skip_validation",
+                    ("--skip-validation",),
+                    "Skip governance validation",
+                    bool,
+                    False,
+                ),
+            ),
+        ),
+    )
+}
+
+
+_METAVARS: dict[type, str] = {str: "TEXT", Path: "PATH", int: "INTEGER"}
+
+
+class UsageError(Exception):
+    """Raised when command-line arguments cannot be parsed."""
+
+
+def _parse_args(command: CommandDef, argv: list[str]) -> dict[str, Any]:
+    """Parse option arguments for a command against its ``ArgDef`` table.
+
+    Args:
+        command: Command whose options are being parsed.
+        argv: Arguments following the command name.
+
+    Returns:
+        Keyword arguments for the command handler.
+
+    Raises:
+        UsageError: On unknown options, missing values or missing required options.
+    """
+    by_flag: dict[str, tuple[ArgDef, bool]] = {}
+    for arg in command.args:
+        for flag in arg.flags:
+            by_flag[flag] = (arg, True)
+        if arg.negation:
+            by_flag[arg.negation] = (arg, False)
+
+    kwargs: dict[str, Any] = {}
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        i += 1
+        flag, has_inline, inline = token.partition("=")
+        if flag not in by_flag:
+            raise UsageError(f"No such option: {token}")
+        arg, flag_value = by_flag[flag]
+
+        if arg.kind is bool:
+            if has_inline:
+                raise UsageError(f"Option '{flag}' does not take a value.")
+            kwargs[arg.dest] = flag_value
+            continue
+
+        if has_inline:
+            value = inline
+        elif i < len(argv):
+            value = argv[i]
+            i += 1
+        else:
+            raise UsageError(f"Option '{flag}' requires an argument.")
+        try:
+            kwargs[arg.dest] = arg.kind(value)
+        except ValueError:
+            raise UsageError(
+                f"Invalid value for '{flag}': {value!r} is not a valid {_METAVARS[arg.kind]}."
+            ) from None
+
+    for arg in command.args:
+        if arg.dest not in kwargs:
+            if arg.required:
+                raise UsageError(f"Missing option '{arg.flags[0]}'.")
+            kwargs[arg.dest] = arg.default
+    return kwargs
+
+
+def _format_app_help() -> str:
+    """Render top-level ``--help`` text from the command table."""
+    width = max(len(name) for name in COMMANDS) + 2
+    lines = [f"Usage: {APP_NAME} [OPTIONS] COMMAND [ARGS]...", "", f"  {APP_HELP}", ""]
+    lines.append("Options:")
+    lines.append("  --help  Show this message and exit.")
+    lines.append("")
+    lines.append("Commands:")
+    lines.extend(f"  {name:<{width}}{command.help}" for name, command in COMMANDS.items())
+    return "\n".join(lines)
+
+
+def _format_command_help(command: CommandDef) -> str:
+    """Render ``<command> --help`` text from the command's ``ArgDef`` table."""
+    rows: list[tuple[str, str]] = []
+    for arg in command.args:
+        spelling = ", ".join(sorted(arg.flags, key=len))
+        if arg.negation:
+            spelling = f"{spelling} / {arg.negation}"
+        if arg.kind is not bool:
+            spelling += f" {_METAVARS[arg.kind]}"
+        suffix = " [required]" if arg.required else ""
+        rows.append((spelling, f"{arg.help}{suffix}"))
+    rows.append(("--help", "Show this message and exit."))
+
+    width = max(len(spelling) for spelling, _ in rows) + 2
+    lines = [
+        f"Usage: {APP_NAME} {command.name} [OPTIONS]",
+        "",
+        f"  {command.help}",
+        "",
+        "Options:",
+    ]
+    lines.extend(f"  {spelling:<{width}}{text}" for spelling, text in rows)
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Console-script entry point: dispatch ``argv`` to a command.
+
+    Set ``HYPER_SPEC_LEGACY_CLI=1`` to route through the Typer app instead.
+
+    Args:
+        argv: Arguments excluding the program name; defaults to ``sys.argv[1:]``.
+
+    Returns:
+        Process exit code.
+    """
+    args = sys.argv[1:] if argv is None else argv
+
+    if os.getenv("HYPER_SPEC_LEGACY_CLI") == "1":
+        _build_app()(args=args, prog_name=APP_NAME)
+        return 0
+
+    match args:
+        case [] | ["--help"]:
+            print(_format_app_help())
+            return 0
+        case [name, *rest] if name in COMMANDS:
+            command = COMMANDS[name]
+        case [name, *_]:
+            print(f"Usage: {APP_NAME} [OPTIONS] COMMAND [ARGS]...", file=sys.stderr)
+            print(f"Error: No such command '{name}'.", file=sys.stderr)
+            return 2
+
+    if "--help" in rest:
+        print(_format_command_help(command))
+        return 0
+
+    try:
+        kwargs = _parse_args(command, rest)
+    except UsageError as e:
+        print(f"Usage: {APP_NAME} {command.name} [OPTIONS]", file=sys.stderr)
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    try:
+        command.handler(**kwargs)
+    except (KeyboardInterrupt, EOFError):
+        print("\nAborted!", file=sys.stderr)
+        return 1
+    return 0
+
+
+@functools.cache
+def _build_app() -> typer.Typer:
+    """Build the Typer app from the ``COMMANDS`` table.
+
+    Each command gets a wrapper whose signature carries ``typer.Option``
+    defaults generated from its ``ArgDef`` entries.
+    """
+    import inspect
+
+    import typer
+
+    typer_app = typer.Typer(help=APP_HELP)
+
+    for command in COMMANDS.values():
+        parameters = []
+        for arg in command.args:
+            decls = list(arg.flags)
+            if arg.negation:
+                decls = [f"{arg.flags[0]}/{arg.negation}"]
+            default = ... if arg.required else arg.default
+            # Typer before 0.12.4 rejects PEP 604 unions, and typer>=0.9.0 is allowed
+            kind: Any = arg.kind
+            if not arg.required and arg.default is None:
+                kind = Optional[kind]  # noqa: UP045
+            parameters.append(
+                inspect.Parameter(
+                    arg.dest,
+                    inspect.Parameter.KEYWORD_ONLY,
+                    default=typer.Option(default, *decls, help=arg.help),
+                    annotation=kind,
+                )
+            )
+
+        def callback(_handler: Callable[..., None] = command.handler, **kwargs: Any) -> None:
+            _handler(**kwargs)
+
+        signature = inspect.Signature(parameters, return_annotation=None)
+        callback.__signature__ = signature  # type: ignore[attr-defined]
+        callback.__annotations__ = {p.name: p.annotation for p in parameters}
+        callback.__doc__ = command.handler.__doc__
+        typer_app.command(name=command.name)(callback)
+
+    return typer_app
+
+
 if __name__ == "__main__":
-    app()
+    sys.exit(main())
@@ -3,6 +3,8 @@
 This package contains bundled Jinja2 templates for spec and plan generation.
 Templates are loaded using importlib.resources when the package is installed,
 or from local specs/.templates/ directory when available for customization.
+Bundled templates that only substitute variables are rendered without Jinja
+(see ``_compiled``).
 
 Available templates:
 - spec_template.md: Feature specification template
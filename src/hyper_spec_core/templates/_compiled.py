@@ -0,0 +1,76 @@
+"""Jinja-free rendering for simple bundled templates.
+
+The bundled templates only substitute variables, optionally with a string
+``default``. Such templates are compiled once into literal and variable
+segments and rendered with ``str.join``, skipping Jinja entirely. Templates
+using any other Jinja syntax are not compiled, and callers fall back to Jinja.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from collections.abc import Callable, Mapping
+from importlib import resources
+from typing import Any
+
+Renderer = Callable[[Mapping[str, Any]], str]
+
+# {{ name }} or {{ name | default("text") }}
+_EXPRESSION_RE = re.compile(
+    r'\{\{\s*([A-Za-z_]\w*)\s*(?:\|\s*default\(\s*"([^"\\]*)"\s*\)\s*)?\}\}'
+)
+_JINJA_DELIMITERS = ("{{", "{%", "{#")
+
+
+def compile_template(source: str) -> Renderer | None:
+    """Compile a template made only of variable substitutions.
+
+    Mirrors Jinja's default behaviour: a single trailing newline is dropped,
+    undefined variables render as their ``default`` or an empty string, and
+    defined values are rendered with ``str()``.
+
+    Args:
+        source: Jinja template source.
+
+    Returns:
+        A function rendering the template from a context mapping, or None if
+        the template uses syntax that needs Jinja.
+    """
+    if "\r" in source:
+        return None
+    source = source.removesuffix("\n")
+
+    segments: list[tuple[str, str | None, str]] = []
+    position = 0
+    for match in _EXPRESSION_RE.finditer(source):
+        segments.append((source[position : match.start()], match[1], match[2] or ""))
+        position = match.end()
+    segments.append((source[position:], None, ""))
+
+    if any(delimiter in literal for literal, _, _ in segments for delimiter in _JINJA_DELIMITERS):
+        return None
+
+    def render(context: Mapping[str, Any]) -> str:
+        parts: list[str] = []
+        for literal, name, default in segments:
+            parts.append(literal)
+            if name is not None:
+                parts.append(str(context[name]) if name in context else default)
+        return "".join(parts)
+
+    return render
+
+
+@functools.cache
+def bundled_renderer(name: str) -> Renderer | None:
+    """Return the compiled renderer for a bundled template.
+
+    Args:
+        name: Template file name, e.g. ``spec_template.md``.
+
+    Returns:
+        Renderer for the template, or None if it must be rendered by Jinja.
+    """
+    source = resources.files("hyper_spec_core.templates").joinpath(name).read_text(encoding="utf-8")
+    return compile_template(source)
@@ -0,0 +1,43 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+from importlib import resources
+
+import pytest
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+
+TEMPLATE_NAMES = ("spec_template.md", "plan_template.md")
+
+
+@pytest.fixture(scope="session")
+def jinja_env(tmp_path_factory: pytest.TempPathFactory) -> Environment:
+    """Jinja2 Environment over the bundled templates, shared by the whole session.
+
+    Template sources are read once into a DictLoader, and compiled templates
+    are also written to a session bytecode cache.
+    """
+    package = resources.files("hyper_spec_core.templates")
+    sources = {name: package.joinpath(name).read_text(encoding="utf-8") for name in TEMPLATE_NAMES}
+    bytecode_cache = FileSystemBytecodeCache(directory=str(tmp_path_factory.mktemp("jinja_bc")))
+    return Environment(
+        loader=DictLoader(sources),
+        auto_reload=False,
+        bytecode_cache=bytecode_cache,
+    )
+
+
+@pytest.fixture(scope="session")
+def rendered_spec(jinja_env: Environment) -> str:
+    """Bundled spec template rendered with a fixed test context."""
+    return jinja_env.get_template("spec_template.md").render(
+        feature_name="test-feature", author="tester"
+    )
+
+
+@pytest.fixture(scope="session")
+def rendered_plan(jinja_env: Environment) -> str:
+    """Bundled plan template rendered with a fixed test context."""
+    return jinja_env.get_template("plan_template.md").render(
+        feature_name="test-feature", confidence_score="95", summary="Test summary"
+    )
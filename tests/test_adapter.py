@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-import pytest
 from pathlib import Path
-from hyper_spec_core.adapter import GovernanceAdapter, GovernanceContext
+
+import pytest
+
+from hyper_spec_core.adapter import GovernanceAdapter, GovernanceContext, _parse_flat_stack
 
 
 class TestGovernanceContext:
@@ -179,6 +181,29 @@ Domain | Application | Infrastructure
         assert "No arbitrary code execution" in ctx.security_controls
         assert "Domain | Application | Infrastructure" in ctx.architectural_layers
 
+    def test_load_context_reuses_cache(
+        self, valid_codex_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that unchanged artifacts are served from the context cache."""
+        first = GovernanceAdapter(valid_codex_dir).load_context()
+        assert (valid_codex_dir / GovernanceAdapter.CACHE_FILE).exists()
+
+        def fail(*args: object) -> None:
+            raise AssertionError("artifacts should not be re-parsed")
+
+        monkeypatch.setattr(GovernanceAdapter, "_parse_stack_yaml", fail)
+
+        assert GovernanceAdapter(valid_codex_dir).load_context() == first
+
+    def test_load_context_cache_invalidated(self, valid_codex_dir: Path) -> None:
+        """Test that editing an artifact invalidates the context cache."""
+        GovernanceAdapter(valid_codex_dir).load_context()
+
+        (valid_codex_dir / "stack.yaml").write_text("allowed_libraries:\n- httpx\n")
+
+        ctx = GovernanceAdapter(valid_codex_dir).load_context()
+        assert ctx.allowed_libs == ["httpx"]
+
     def test_load_context_missing_directory(self, tmp_path: Path) -> None:
         """Test that missing directory raises FileNotFoundError."""
         adapter = GovernanceAdapter(tmp_path / "nonexistent")
@@ -218,6 +243,9 @@ Domain | Application | Infrastructure
         assert "security.md" in captured.err
         assert "architecture.md" in captured.err
 
+        # Incomplete contexts are not cached, so warnings repeat on the next load
+        assert not (minimal_codex_dir / GovernanceAdapter.CACHE_FILE).exists()
+
     def test_parse_stack_yaml_missing_keys(self, tmp_path: Path) -> None:
         """Test defensive parsing when YAML keys are missing."""
         codex = tmp_path / ".codex"
@@ -237,6 +265,39 @@ rules:
         assert ctx.allowed_libs == []
         assert ctx.banned_libs == []
 
+    def test_parse_flat_stack(self) -> None:
+        """Test the fast path for the flat codex weave layout."""
+        data = _parse_flat_stack(
+            "python_version: '3.11'\n"
+            "allowed_libraries:\n"
+            "- pyyaml\n"
+            "- pytest-cov\n"
+            "banned_libraries: []\n"
+        )
+
+        assert data == {
+            "python_version": "3.11",
+            "allowed_libraries": ["pyyaml", "pytest-cov"],
+            "banned_libraries": [],
+        }
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "rules:\n  material: {}\n",
+            "allowed_libraries: [fastapi, pydantic]\n",
+            "python_version: 3.11\n",
+            "allowed_libraries:\n  - fastapi  # comment\n",
+            "allowed_libraries:\n- e+1\n  - d\n",
+            "allowed_libraries:\n  - a\n- b\n",
+            "allowed_libraries:\n- a\nbanned_libraries: []\n- b\n",
+            "python_version:\t'3.11'\n",
+        ],
+    )
+    def test_parse_flat_stack_defers_to_yaml(self, text: str) -> None:
+        """Test that anything outside the flat layout falls back to YAML."""
+        assert _parse_flat_stack(text) is None
+
     def test_extract_section_valid(self) -> None:
         """Test regex extraction with valid anchor tags."""
         content = """
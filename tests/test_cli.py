@@ -2,98 +2,321 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import functools
+import io
+import json
+import os
+import re
+import shutil
+import stat
+import subprocess
+from typing import TYPE_CHECKING
 
 import pytest
+from jinja2 import Environment, FileSystemBytecodeCache
 from typer.testing import CliRunner
-from hyper_spec_core.cli import app
 
+from hyper_spec_core.cli import (
+    COMMANDS,
+    UsageError,
+    _parse_args,
+    _run_governance_validation,
+    _template_env,
+    _template_sources,
+    app,
+    main,
+)
+from hyper_spec_core.cli import init as init_cmd
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 runner = CliRunner()
 
+_HELP_CMDS_RE = re.compile(r"\b(?:init|new|plan|implement)\b")
+
+
+@functools.cache
+def _help(args: tuple[str, ...]) -> str:
+    """Help output for ``args``, rendered once per session."""
+    result = CliRunner().invoke(app, list(args))
+    assert result.exit_code == 0
+    return result.stdout
+
 
 class TestCLIEntryPoint:
     """Tests for the CLI entry point."""
 
     def test_help_shows_commands(self) -> None:
         """Test that --help shows available commands."""
-        result = runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        assert "init" in result.stdout
-        assert "new" in result.stdout
-        assert "plan" in result.stdout
-        assert "implement" in result.stdout
+        commands = set(_HELP_CMDS_RE.findall(_help(("--help",))))
+        assert commands == {"init", "new", "plan", "implement"}
 
     def test_init_help(self) -> None:
         """Test init command help."""
-        result = runner.invoke(app, ["init", "--help"])
-        assert result.exit_code == 0
-        assert "--force" in result.stdout
+        assert "--force" in _help(("init", "--help"))
+
+
+class TestFastDispatcher:
+    """Tests for the table-driven argv dispatcher."""
+
+    def test_help_lists_commands(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that --help lists every command without importing Typer."""
+        assert main(["--help"]) == 0
+        out = capsys.readouterr().out
+        for name in COMMANDS:
+            assert name in out
+
+    def test_command_help(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test per-command help output."""
+        assert main(["init", "--help"]) == 0
+        assert "--force" in capsys.readouterr().out
+
+    def test_unknown_command(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that an unknown command exits with usage error code."""
+        assert main(["bogus"]) == 2
+        assert "No such command" in capsys.readouterr().err
+
+    def test_missing_required_option(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that a missing required option exits with usage error code."""
+        assert main(["plan"]) == 2
+        assert "--spec" in capsys.readouterr().err
+
+    def test_eof_at_prompt_aborts(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test that EOF at an interactive prompt aborts instead of raising."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "specs").mkdir()
+        monkeypatch.setattr("sys.stdin", io.StringIO(""))
+
+        assert main(["new", "-n", "g"]) == 1
+        assert "Aborted!" in capsys.readouterr().err
+
+    def test_parse_args_forms(self) -> None:
+        """Test short, long, inline and negated option spellings."""
+        kwargs = _parse_args(COMMANDS["new"], ["-n", "demo", "--no-interactive"])
+        assert kwargs == {"name": "demo", "interactive": False}
+
+        kwargs = _parse_args(COMMANDS["plan"], ["--spec=specs/x/spec.md"])
+        assert kwargs["spec_file"].as_posix() == "specs/x/spec.md"
+        assert kwargs["model"] == "gpt-4-turbo"
+        assert kwargs["governance_path"] is None
+
+    def test_parse_args_rejects_flag_value(self) -> None:
+        """Test that boolean flags reject inline values."""
+        with pytest.raises(UsageError):
+            _parse_args(COMMANDS["init"], ["--force=yes"])
 
 
 class TestInitCommand:
     """Tests for the init command."""
 
-    def test_init_creates_directories(self, tmp_path: Path) -> None:
-        """Test that init creates required directories."""
-        # Skip if uv is not available
-        import subprocess as sp
-        uv_check = sp.run(["uv", "--version"], capture_output=True)
-        if uv_check.returncode != 0:
+    def test_init_creates_directories(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test that init creates required directories and reports existing ones."""
+        monkeypatch.setattr(shutil, "which", lambda name, *args, **kwargs: f"/usr/bin/{name}")
+        monkeypatch.chdir(tmp_path)
+
+        init_cmd(force=False)
+
+        assert (tmp_path / "specs" / ".templates").is_dir()
+        assert (tmp_path / ".vscode").is_dir()
+        out = capsys.readouterr().out
+        assert all(f"Created {d}" in out for d in ("specs", "specs/.templates", ".vscode"))
+
+        init_cmd(force=False)
+
+        out = capsys.readouterr().out
+        assert "Created" not in out
+        assert all(f"{d} already exists." in out for d in ("specs", "specs/.templates", ".vscode"))
+
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("cli_subprocess")
+    def test_init_entry_point(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that init runs through the Typer entry point."""
+        if shutil.which("uv") is None:
             pytest.skip("uv not available")
 
-        import os
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            cli_result = runner.invoke(app, ["init"])
-            # Should either succeed or create directories
-            assert (tmp_path / "specs").exists() or cli_result.exit_code == 0
-        finally:
-            os.chdir(original_cwd)
+        monkeypatch.chdir(tmp_path)
+        cli_result = runner.invoke(app, ["init"], catch_exceptions=False)
+
+        assert cli_result.exit_code == 0
+
+
+class TestPlanBatch:
+    """Tests for the plan-batch command."""
+
+    @pytest.fixture
+    def spec_files(self, tmp_path: Path) -> list[Path]:
+        """Create two feature specs."""
+        paths = []
+        for name in ("alpha", "beta"):
+            spec = tmp_path / "specs" / name / "spec.md"
+            spec.parent.mkdir(parents=True)
+            spec.write_text(f"# Feature Specification: {name}")
+            paths.append(spec)
+        return paths
+
+    def test_plans_every_matching_spec(self, tmp_path: Path, spec_files: list[Path]) -> None:
+        """Test that a plan.md is generated next to each matching spec."""
+        pattern = str(tmp_path / "specs" / "*" / "spec.md")
+
+        assert main(["plan-batch", "--specs", pattern, "-j", "1", "-g", str(tmp_path)]) == 0
+
+        for spec in spec_files:
+            assert spec.parent.name in (spec.parent / "plan.md").read_text()
+
+    def test_batch_file(self, tmp_path: Path, spec_files: list[Path]) -> None:
+        """Test that --batch-file writes one Batch API request per spec."""
+        pattern = str(tmp_path / "specs" / "*" / "spec.md")
+        batch_file = tmp_path / "batch.jsonl"
+
+        exit_code = main(
+            ["plan-batch", "-s", pattern, "--batch-file", str(batch_file), "-g", str(tmp_path)]
+        )
+
+        assert exit_code == 0
+        requests = [json.loads(line) for line in batch_file.read_text().splitlines()]
+        assert [r["custom_id"] for r in requests] == [str(p) for p in spec_files]
+        assert all(r["url"] == "/v1/chat/completions" for r in requests)
+        assert not (spec_files[0].parent / "plan.md").exists()
+
+    def test_skips_directories(self, tmp_path: Path, spec_files: list[Path]) -> None:
+        """Test that directories matched by the glob are not treated as specs."""
+        pattern = str(tmp_path / "specs" / "**")
+
+        assert main(["plan-batch", "-s", pattern, "-j", "1", "-g", str(tmp_path)]) == 0
+        assert all((spec.parent / "plan.md").exists() for spec in spec_files)
+
+    def test_only_directories_match(
+        self, tmp_path: Path, spec_files: list[Path], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that a glob matching only directories is reported as no specs."""
+        pattern = str(tmp_path / "specs" / "*")
+
+        with pytest.raises(SystemExit) as exc_info:
+            main(["plan-batch", "-s", pattern, "-g", str(tmp_path)])
+
+        assert exc_info.value.code == 1
+        assert "No spec files match" in capsys.readouterr().out
+
+    def test_rejects_shared_plan_target(
+        self, tmp_path: Path, spec_files: list[Path], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that two specs in one directory are rejected instead of racing on plan.md."""
+        (spec_files[0].parent / "spec-v2.md").write_text("# Feature Specification: alpha v2")
+        pattern = str(tmp_path / "specs" / "*" / "spec*.md")
+
+        with pytest.raises(SystemExit) as exc_info:
+            main(["plan-batch", "-s", pattern, "-g", str(tmp_path)])
+
+        assert exc_info.value.code == 1
+        assert "would both write" in capsys.readouterr().out
+        assert not any((spec.parent / "plan.md").exists() for spec in spec_files)
+
+
+class TestGovernanceValidation:
+    """Tests for the governance validator hook."""
+
+    def test_missing_validator_skips_subprocess(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a validator absent from PATH is reported without spawning it."""
+        monkeypatch.setenv("HYPER_VALIDATOR_CMD", "hyper-spec-no-such-validator --check")
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("subprocess should not be started")
+
+        monkeypatch.setattr(subprocess, "Popen", fail)
+
+        assert _run_governance_validation() is False
+
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("cli_subprocess")
+    def test_validator_passes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a zero exit status is reported as verified."""
+        monkeypatch.setenv("HYPER_VALIDATOR_CMD", "true")
+
+        assert _run_governance_validation() is True
+
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("cli_subprocess")
+    def test_validator_found_without_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that an unset PATH falls back to os.defpath like subprocess does."""
+        monkeypatch.delenv("PATH", raising=False)
+        monkeypatch.setenv("HYPER_VALIDATOR_CMD", "true")
+
+        assert _run_governance_validation() is True
+
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("cli_subprocess")
+    def test_validator_failure_streams_output(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that validator output is echoed and a non-zero exit is a violation."""
+        monkeypatch.setenv("HYPER_VALIDATOR_CMD", "sh -c 'echo out; echo err >&2; exit 3'")
+
+        assert _run_governance_validation() is False
+
+        stdout = capsys.readouterr().out
+        assert "out" in stdout
+        assert "err" in stdout
+        assert "Governance Violation Detected" in stdout
 
 
 class TestTemplateLoading:
     """Tests for template loading functionality."""
 
-    def test_bundled_templates_accessible(self) -> None:
+    def test_bundled_templates_accessible(self, jinja_env: Environment) -> None:
         """Test that bundled templates can be loaded."""
-        from jinja2 import Environment, PackageLoader
-
-        env = Environment(loader=PackageLoader("hyper_spec_core", "templates"))
-        
-        # Should be able to get template without error
-        spec_template = env.get_template("spec_template.md")
-        assert spec_template is not None
-        
-        plan_template = env.get_template("plan_template.md")
-        assert plan_template is not None
-
-    def test_spec_template_renders(self) -> None:
-        """Test that spec template renders with context."""
-        from jinja2 import Environment, PackageLoader
-
-        env = Environment(loader=PackageLoader("hyper_spec_core", "templates"))
-        template = env.get_template("spec_template.md")
-        
-        content = template.render(feature_name="test-feature", author="tester")
-        
-        assert "test-feature" in content
-        assert "tester" in content
-
-    def test_plan_template_renders(self) -> None:
-        """Test that plan template renders with context."""
-        from jinja2 import Environment, PackageLoader
-
-        env = Environment(loader=PackageLoader("hyper_spec_core", "templates"))
-        template = env.get_template("plan_template.md")
-        
-        content = template.render(
-            feature_name="test-feature",
-            confidence_score="95",
-            summary="Test summary",
-        )
-        
-        assert "test-feature" in content
-        assert "95" in content
-        assert "Test summary" in content
+        assert all(jinja_env.get_template(n) for n in ("spec_template.md", "plan_template.md"))
+
+    @pytest.mark.parametrize(
+        ("rendered", "expected"),
+        [
+            ("rendered_spec", ["test-feature", "tester"]),
+            ("rendered_plan", ["test-feature", "95", "Test summary"]),
+        ],
+        ids=["spec", "plan"],
+    )
+    def test_template_renders(
+        self, request: pytest.FixtureRequest, rendered: str, expected: list[str]
+    ) -> None:
+        """Test that bundled templates render with context."""
+        content = request.getfixturevalue(rendered)
+
+        missing = [s for s in expected if s not in content]
+        assert not missing, f"missing: {missing}"
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership checks")
+    def test_bytecode_cache_dir_is_private(self, tmp_path: Path) -> None:
+        """Test that compiled templates are cached in a user-owned 0700 directory."""
+        bytecode_cache = _template_env(True, str(tmp_path)).bytecode_cache
+
+        assert isinstance(bytecode_cache, FileSystemBytecodeCache)
+        st = os.lstat(bytecode_cache.directory)
+        assert st.st_uid == os.getuid()
+        assert stat.S_IMODE(st.st_mode) == stat.S_IRWXU
+
+    def test_local_templates_ignore_stray_files(self, tmp_path: Path) -> None:
+        """Test that unrelated files in a local override dir are never read."""
+        (tmp_path / "spec_template.md").write_text("Local {{ feature_name }}")
+        (tmp_path / ".DS_Store").write_bytes(b"\x00\x05\x16\x07\xff\xfe")
+
+        assert _template_sources(True, str(tmp_path)) == {
+            "spec_template.md": "Local {{ feature_name }}"
+        }
+
+    def test_local_templates_can_include(self, tmp_path: Path) -> None:
+        """Test that local overrides can still include their own partials."""
+        (tmp_path / "spec_template.md").write_text('{% include "header.md" %} body')
+        (tmp_path / "header.md").write_text("# {{ feature_name }}")
+
+        env = _template_env(True, str(tmp_path))
+        assert env.get_template("spec_template.md").render(feature_name="f") == "# f body"
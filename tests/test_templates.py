@@ -0,0 +1,43 @@
+"""Tests for the precompiled bundled-template renderer."""
+
+from __future__ import annotations
+
+import pytest
+from jinja2 import Environment
+
+from hyper_spec_core.templates._compiled import bundled_renderer, compile_template
+
+
+class TestCompiledTemplates:
+    """Tests for Jinja-free rendering of simple templates."""
+
+    @pytest.mark.parametrize("name", ["spec_template.md", "plan_template.md"])
+    @pytest.mark.parametrize(
+        "context",
+        [
+            {},
+            {"feature_name": "test-feature", "author": "tester", "confidence_score": "95"},
+            {"feature_name": "x", "complexity": 7, "summary": None},
+        ],
+    )
+    def test_matches_jinja(
+        self, jinja_env: Environment, name: str, context: dict[str, object]
+    ) -> None:
+        """Test that bundled templates render exactly as Jinja renders them."""
+        renderer = bundled_renderer(name)
+
+        assert renderer is not None
+        assert renderer(context) == jinja_env.get_template(name).render(**context)
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "{% if x %}y{% endif %}",
+            "{{ name | upper }}",
+            "{# comment #}",
+            "{{ a.b }}",
+        ],
+    )
+    def test_needs_jinja(self, source: str) -> None:
+        """Test that templates using other Jinja syntax are not compiled."""
+        assert compile_template(source) is None